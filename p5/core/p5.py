@@ -18,9 +18,10 @@
 
 """Environment Variables for P5 sketches"""
 
-from .tess import Tessellator
-
 sketch = None
 renderer = None
 mode = None
-tess = Tessellator()
+
+# The GLU tessellator is created by the renderer when a sketch starts,
+# so that merely importing p5 doesn't load the OpenGL libraries.
+tess = None
@@ -49,11 +49,14 @@ def _draw_on_return(func):
     """Set shape parameters to default renderer parameters
 
     """
+    # The renderer is only known once the sketch runs, so bind the
+    # module-level drawing function instead of `p5.renderer.render`.
+    draw = draw_shape
 
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
         s = func(*args, **kwargs)
-        draw_shape(s)
+        draw(s)
         return s
 
     return wrapped
@@ -20,6 +20,7 @@
 
 import builtins
 
+import glfw
 from PIL import Image
 from vispy import app
 
@@ -29,6 +30,37 @@ from ..events import KeyEvent
 from ..events import MouseEvent
 from ..events import handler_names
 
+# GLFW has no dedicated "move" or "wait" cursors, so those fall back
+# to the closest standard shapes.
+_CURSOR_CODES = {
+    'ARROW': glfw.ARROW_CURSOR,
+    'CROSS': glfw.CROSSHAIR_CURSOR,
+    'HAND': glfw.HAND_CURSOR,
+    'MOVE': glfw.HAND_CURSOR,
+    'TEXT': glfw.IBEAM_CURSOR,
+    'WAIT': glfw.ARROW_CURSOR,
+}
+
+# Standard cursors are created lazily (GLFW needs to be initialized
+# first) and reused on subsequent calls to `cursor()`.
+_cursor_cache = {}
+
+# Positions of the handlers in `VispySketch.handlers`. Events are
+# queued and dispatched by index rather than by handler name.
+_KEY_PRESSED = handler_names.index('key_pressed')
+_KEY_RELEASED = handler_names.index('key_released')
+_KEY_TYPED = handler_names.index('key_typed')
+_MOUSE_CLICKED = handler_names.index('mouse_clicked')
+_MOUSE_DOUBLE_CLICKED = handler_names.index('mouse_double_clicked')
+_MOUSE_DRAGGED = handler_names.index('mouse_dragged')
+_MOUSE_MOVED = handler_names.index('mouse_moved')
+_MOUSE_PRESSED = handler_names.index('mouse_pressed')
+_MOUSE_RELEASED = handler_names.index('mouse_released')
+_MOUSE_WHEEL = handler_names.index('mouse_wheel')
+
+# Only the latest of a run of these events is delivered to the sketch.
+_MOTION_HANDLERS = (_MOUSE_MOVED, _MOUSE_DRAGGED)
+
 
 def _dummy(*args, **kwargs):
     """Eat all arguments, do nothing.
@@ -75,11 +107,21 @@ class VispySketch(app.Canvas):
         self.setup_done = False
         self.timer = app.Timer(1.0 / frame_rate, connect=self.on_timer)
 
-        self.handlers = dict()
+        # vispy averages the frame rate over one second windows; only
+        # publish it to the builtins when a new average is available.
+        builtins.frame_rate = frame_rate
+        self.measure_fps(callback=self._update_frame_rate)
+
+        # Store each handler along with its argument count so that
+        # handlers that don't take an event can be called directly.
+        self.handlers = []
         for handler_name in handler_names:
-            self.handlers[handler_name] = handlers.get(handler_name, _dummy)
+            function = handlers.get(handler_name, _dummy)
+            self.handlers.append((function, function.__code__.co_argcount))
 
         self.handler_queue = []
+        self._motion_slots = dict()
+        self._frame_pending = False
 
         self._save_fname = 'screen'
         self._save_fname_num = 0
@@ -88,22 +130,39 @@ class VispySketch(app.Canvas):
         p5.renderer.initialize_renderer()
         p5.renderer.clear()
 
-    def on_timer(self, event):
-        self.measure_fps(callback=lambda _: None)
-        builtins.frame_rate = round(self.fps, 2)
+    def run_setup(self):
+        """Run the setup method and show the sketch window.
 
+        This is called once, before the event loop starts, so that the
+        first frame doesn't have to wait for a timer tick.
+        """
         with p5.renderer.draw_loop():
-            if not self.setup_done:
-                builtins.frame_count += 1
-                self.setup_method()
-                self.setup_done = True
-                self.show(visible=True)
-                if self.redraw is None:
-                    self.redraw = False
-                if self.looping is None:
-                    self.looping = True
-
-            elif self.redraw:
+            builtins.frame_count += 1
+            self.setup_method()
+
+        self.setup_done = True
+        if self.redraw is None:
+            self.redraw = False
+        if self.looping is None:
+            self.looping = True
+
+        if self._save_flag:
+            self._save_buffer()
+        self.show(visible=True)
+        self._frame_pending = True
+
+    def on_timer(self, event):
+        renderer = p5.renderer
+        handlers = self.handlers
+        handler_queue = self.handler_queue
+
+        # Nothing gets drawn on this tick, so leave the last frame on
+        # the screen instead of running the renderer's draw loop.
+        if not (self.redraw or self.looping or handler_queue):
+            return
+
+        with renderer.draw_loop():
+            if self.redraw:
                 builtins.frame_count += 1
                 self.draw_method()
                 self.redraw = False
@@ -114,15 +173,28 @@ class VispySketch(app.Canvas):
             elif not self.looping:
                 pass
 
-            while len(self.handler_queue) != 0:
-                function, event = self.handler_queue.pop(0)
-                event._update_builtins()
-                function(event)
+            pending = handler_queue[:]
+            del handler_queue[:]
+            self._motion_slots.clear()
+            last_event = None
+            for handler_idx, event in pending:
+                function, argcount = handlers[handler_idx]
+                if event is not last_event:
+                    event._update_builtins()
+                    last_event = event
+                if argcount == 0:
+                    function()
+                else:
+                    function(event)
 
         if self._save_flag:
             self._save_buffer()
+        self._frame_pending = True
         self.update()
 
+    def _update_frame_rate(self, fps):
+        builtins.frame_rate = round(fps, 2)
+
     def _save_buffer(self):
         """Save the renderer buffer to the given file.
         """
@@ -146,11 +218,34 @@ class VispySketch(app.Canvas):
         self._save_fname_num = self._save_fname_num + 1
         self._save_flag = True
 
+    def set_cursor(self, cursor_type):
+        """Show the mouse cursor and set it to the given type.
+        """
+        code = _CURSOR_CODES.get(cursor_type, glfw.ARROW_CURSOR)
+        cursor = _cursor_cache.get(code)
+        if cursor is None:
+            cursor = glfw.create_standard_cursor(code)
+            _cursor_cache[code] = cursor
+
+        glfw.set_input_mode(self.native, glfw.CURSOR, glfw.CURSOR_NORMAL)
+        glfw.set_cursor(self.native, cursor)
+
+    def hide_cursor(self):
+        """Hide the mouse cursor while it is over the sketch window.
+        """
+        glfw.set_input_mode(self.native, glfw.CURSOR, glfw.CURSOR_HIDDEN)
+
     def on_close(self, event):
         exit()
 
     def on_draw(self, event):
-        pass
+        # Draw requests that don't follow a new frame (the window was
+        # exposed, etc.) need the last frame to be put on screen again.
+        if self._frame_pending:
+            self._frame_pending = False
+        else:
+            with p5.renderer.draw_loop():
+                pass
 
     def on_resize(self, event):
         builtins.width = int(self.size[0])
@@ -160,45 +255,67 @@ class VispySketch(app.Canvas):
         with p5.renderer.draw_loop():
             p5.renderer.clear()
 
-    def _enqueue_event(self, handler_name, event):
+    def _enqueue_event(self, event, *indices):
+        """Update the builtins from `event` and queue it once for each
+        of the given handler indices.
+        """
         event._update_builtins()
-        self.handler_queue.append((self.handlers[handler_name], event))
+
+        for handler_idx in indices:
+            # Consecutive motion events are coalesced: a newer one
+            # replaces the queued one until some other event is queued
+            # in between.
+            if handler_idx in _MOTION_HANDLERS:
+                slot = self._motion_slots.get(handler_idx)
+                if slot is not None:
+                    self.handler_queue[slot] = (handler_idx, event)
+                    continue
+                self._motion_slots[handler_idx] = len(self.handler_queue)
+            else:
+                self._motion_slots.clear()
+
+            self.handler_queue.append((handler_idx, event))
 
     def on_key_press(self, event):
         kev = KeyEvent(event, active=True)
-        self._enqueue_event('key_pressed', kev)
+        self._enqueue_event(kev, _KEY_PRESSED)
 
     def on_key_release(self, event):
         kev = KeyEvent(event)
-        self._enqueue_event('key_released', kev)
-        if not (event.text == ''):
-            self._enqueue_event('key_typed', kev)
+        if event.text == '':
+            self._enqueue_event(kev, _KEY_RELEASED)
+        else:
+            self._enqueue_event(kev, _KEY_RELEASED, _KEY_TYPED)
 
     def on_mouse_press(self, event):
         mev = MouseEvent(event, active=True)
-        self._enqueue_event('mouse_pressed', mev)
+        self._enqueue_event(mev, _MOUSE_PRESSED)
 
     def on_mouse_double_click(self, event):
         mev = MouseEvent(event)
-        self._enqueue_event('mouse_double_clicked', mev)
+        self._enqueue_event(mev, _MOUSE_DOUBLE_CLICKED)
 
     def on_mouse_release(self, event):
         mev = MouseEvent(event)
-        self._enqueue_event('mouse_released', mev)
-        self._enqueue_event('mouse_clicked', mev)
+        self._enqueue_event(mev, _MOUSE_RELEASED, _MOUSE_CLICKED)
 
     def on_mouse_move(self, event):
         mev = MouseEvent(event, active=builtins.mouse_is_pressed)
-        self._enqueue_event('mouse_moved', mev)
         if builtins.mouse_is_pressed:
-            self._enqueue_event('mouse_dragged', mev)
+            self._enqueue_event(mev, _MOUSE_MOVED, _MOUSE_DRAGGED)
+        else:
+            self._enqueue_event(mev, _MOUSE_MOVED)
 
     def on_mouse_wheel(self, event):
         mev = MouseEvent(event, active=builtins.mouse_is_pressed)
-        self._enqueue_event('mouse_wheel', mev)
+        self._enqueue_event(mev, _MOUSE_WHEEL)
 
+    # There are no 'touch' or 'stylus' entries in `handler_names` yet.
+    # Add them there, along with matching index constants, before
+    # enabling these:
+    #
     # def on_touch(self, event):
-    #     self._enqueue_event('touch', event)
+    #     self._enqueue_event(event, _TOUCH)
 
     # def on_stylus(self, event):
-    #     self._enqueue_event('stylus', event)
+    #     self._enqueue_event(event, _STYLUS)
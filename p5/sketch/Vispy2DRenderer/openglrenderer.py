@@ -3,6 +3,7 @@ import numpy as np
 
 from p5.core import p5
 from p5.core.constants import SType, ROUND, MITER
+from p5.core.tess import Tessellator
 from .shape import Arc
 
 from dataclasses import dataclass
@@ -270,6 +271,9 @@ class OpenGLRenderer(ABC):
         self.default_prog = Program(src_default.vert, src_default.frag)
 
     def initialize_renderer(self):
+        if p5.tess is None:
+            p5.tess = Tessellator()
+
         self.fbuffer = FrameBuffer()
 
         vertices = np.array([[-1.0, -1.0],
@@ -23,7 +23,6 @@ import math
 import numpy as np
 import builtins
 import time
-from functools import wraps
 
 from .events import handler_names
 
@@ -57,23 +56,6 @@ builtins.pixels = None
 builtins.start_time = 0
 builtins.current_renderer = None
 
-def _fix_interface(func):
-    """Make sure that `func` takes at least one argument as input.
-
-    :returns: a new function that accepts arguments.
-    :rtype: func
-    """
-
-    @wraps(func)
-    def fixed_func(*args, **kwargs):
-        return_value = func()
-        return return_value
-
-    if func.__code__.co_argcount == 0:
-        return fixed_func
-    else:
-        return func
-
 
 def draw():
     """Continuously execute code defined inside.
@@ -134,8 +116,7 @@ def run(sketch_setup=None, sketch_draw=None,
     handlers = dict()
     for handler in handler_names:
         if hasattr(__main__, handler):
-            hfunc = getattr(__main__, handler)
-            handlers[handler] = _fix_interface(hfunc)
+            handlers[handler] = getattr(__main__, handler)
 
     if renderer == "vispy":
         import vispy
@@ -163,6 +144,7 @@ def run(sketch_setup=None, sketch_draw=None,
         builtins.pixel_y_density = physical_height // height
         builtins.start_time = time.perf_counter()
 
+        p5.sketch.run_setup()
         p5.sketch.timer.start()
 
         app.run()
@@ -217,7 +199,11 @@ def no_loop():
 
     """
     p5.sketch.looping = False
-    p5.sketch.redraw = True
+
+    # When called from `setup()`, `draw()` should still run exactly
+    # once. Afterwards, this must not schedule an extra frame.
+    if not p5.sketch.setup_done:
+        p5.sketch.redraw = True
 
 
 def loop():
@@ -265,8 +251,7 @@ def exit(*args, **kwargs):
 def no_cursor():
     """Hide the mouse cursor.
     """
-    # window.set_mouse_visible(False)
-    raise NotImplementedError
+    p5.sketch.hide_cursor()
 
 
 def cursor(cursor_type='ARROW'):
@@ -278,19 +263,7 @@ def cursor(cursor_type='ARROW'):
     :type cursor_type: str
 
     """
-    # cursor_map = {
-    #     'ARROW': window.CURSOR_DEFAULT,
-    #     'CROSS': window.CURSOR_CROSSHAIR,
-    #     'HAND': window.CURSOR_HAND,
-    #     'MOVE': window.CURSOR_SIZE,
-    #     'TEXT': window.CURSOR_TEXT,
-    #     'WAIT': window.CURSOR_WAIT
-    # }
-    # selected_cursor = cursor_map.get(cursor_type, 'ARROW')
-    # cursor = window.get_system_mouse_cursor(selected_cursor)
-    # window.set_mouse_visible(True)
-    # window.set_mouse_cursor(cursor)
-    raise NotImplementedError
+    p5.sketch.set_cursor(cursor_type)
 
 
 def save(filename='screen.png'):